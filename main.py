@@ -4,11 +4,14 @@ Main entry point for DCR framework.
 
 import argparse
 import os
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
 from pathlib import Path
 
 from src.core import DCRCalculator
 from src.utils import DataLoader, OutputFormatter
-from config import BENCHMARKS, DATA_DIR, OUTPUT_DIR
+from config import BENCHMARKS, DATA_DIR, OUTPUT_DIR, DCR_SETTINGS
 
 
 def analyze_benchmark(benchmark_name: str, save_csv: bool = False):
@@ -19,48 +22,63 @@ def analyze_benchmark(benchmark_name: str, save_csv: bool = False):
         benchmark_name: Name of the benchmark (sst2, liar2, gsm8k)
         save_csv: Whether to save results to CSV
     """
+    sys.stdout.write(build_benchmark_report(benchmark_name, save_csv))
+
+
+def build_benchmark_report(benchmark_name: str, save_csv: bool = False) -> str:
+    """
+    Analyze a specific benchmark dataset and return its console report.
+    
+    Args:
+        benchmark_name: Name of the benchmark (sst2, liar2, gsm8k)
+        save_csv: Whether to save results to CSV
+        
+    Returns:
+        Report text, ready to be written to stdout
+    """
     if benchmark_name not in BENCHMARKS:
-        print(f"Error: Unknown benchmark '{benchmark_name}'")
-        print(f"Available benchmarks: {', '.join(BENCHMARKS.keys())}")
-        return
+        return (f"Error: Unknown benchmark '{benchmark_name}'\n"
+                f"Available benchmarks: {', '.join(BENCHMARKS.keys())}\n")
     
     benchmark_info = BENCHMARKS[benchmark_name]
     data_file = DATA_DIR / benchmark_info['file']
     
-    print(f"\n{'='*70}")
-    print(f"Analyzing {benchmark_info['name']} ({benchmark_info['task']})")
-    print(f"{'='*70}\n")
+    # Collect the whole report so it can be written in one call
+    output = [
+        f"\n{'='*70}",
+        f"Analyzing {benchmark_info['name']} ({benchmark_info['task']})",
+        f"{'='*70}\n"
+    ]
     
     # Load data
     try:
-        data = DataLoader.load_csv(str(data_file))
+        data = DataLoader.load_csv_soa(str(data_file))
     except FileNotFoundError:
-        print(f"Error: Data file not found: {data_file}")
-        return
+        output.append(f"Error: Data file not found: {data_file}")
+        return '\n'.join(output) + '\n'
     
     # Process data
-    calculator = DCRCalculator()
+    calculator = DCRCalculator(nearest_bin=DCR_SETTINGS['nearest_bin_lookup'])
     results_dict = calculator.process_experiment_data(data)
     
     # Display results
-    OutputFormatter.print_header()
-    for result in results_dict['results']:
-        OutputFormatter.print_result(result)
-    
-    OutputFormatter.print_statistics(
+    output.append(OutputFormatter.format_header())
+    output.extend(OutputFormatter.format_result(result) for result in results_dict['results'])
+    output.append(OutputFormatter.format_statistics(
         results_dict['average_error'],
         results_dict['correlation'],
         results_dict['p_value']
-    )
+    ))
     
     # Save to CSV if requested
     if save_csv:
         output_file = OUTPUT_DIR / f"{benchmark_name}_results.csv"
         os.makedirs(OUTPUT_DIR, exist_ok=True)
         DataLoader.save_results_csv(results_dict['results'], str(output_file))
-        print(f"\nResults saved to: {output_file}")
+        output.append(f"\nResults saved to: {output_file}")
     
-    print()
+    output.append('')
+    return '\n'.join(output) + '\n'
 
 
 def main():
@@ -101,8 +119,15 @@ Examples:
     
     # Run analysis
     if args.all:
-        for benchmark in BENCHMARKS.keys():
-            analyze_benchmark(benchmark, args.save_csv)
+        # Benchmarks are independent, so analyze them in parallel and
+        # write the reports in their original order
+        benchmarks = list(BENCHMARKS.keys())
+        workers = min(len(benchmarks), os.cpu_count() or 1)
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            reports = executor.map(partial(build_benchmark_report, save_csv=args.save_csv),
+                                   benchmarks)
+            for report in reports:
+                sys.stdout.write(report)
     else:
         analyze_benchmark(args.benchmark, args.save_csv)
 
@@ -2,19 +2,27 @@
 DCR calculation and analysis module.
 """
 
-from typing import List, Tuple, Dict
+import math
+from typing import List, Tuple, Dict, Union
 import numpy as np
-from scipy.stats import pearsonr
 from .fuzzy_system import FuzzySystem
 
+# Column order of experimental data rows
+EXPERIMENT_COLUMNS = ('bdc_level', 'model', 'test1', 'test2', 'test3', 'test4', 'accuracy')
+
 
 class DCRCalculator:
     """
     Main calculator for Data Contamination Risk (DCR) analysis.
     """
     
-    def __init__(self):
-        self.fuzzy_system = FuzzySystem()
+    def __init__(self, nearest_bin: bool = False):
+        """
+        Args:
+            nearest_bin: Use nearest grid point lookup instead of linear
+                interpolation when fuzzifying experiment data in batch
+        """
+        self.fuzzy_system = FuzzySystem(nearest_bin=nearest_bin)
         
     def calculate_dcr(self, s1: float, s2: float, s3: float, s4: float) -> float:
         """
@@ -89,65 +97,93 @@ class DCRCalculator:
         """
         if len(dcr_values) < 2 or len(accuracy_values) < 2:
             return 0.0, 1.0
-            
-        return pearsonr(dcr_values, accuracy_values)
+        
+        x = np.asarray(dcr_values, dtype=np.float64)
+        y = np.asarray(accuracy_values, dtype=np.float64)
+        xm = x - x.mean()
+        ym = y - y.mean()
+        
+        denominator = math.sqrt((xm * xm).sum() * (ym * ym).sum())
+        if denominator == 0.0:
+            # Correlation is undefined for constant input
+            return float('nan'), float('nan')
+        r = max(min(float((xm * ym).sum()) / denominator, 1.0), -1.0)
+        
+        # Two-sided p-value from the t-distribution with n - 2 degrees of freedom
+        n = len(x)
+        if n == 2:
+            return r, 1.0
+        if abs(r) == 1.0:
+            return r, 0.0
+        from scipy.special import stdtr
+        t = r * math.sqrt((n - 2) / (1.0 - r * r))
+        p_value = 2.0 * stdtr(n - 2, -abs(t))
+        
+        return r, float(p_value)
     
-    def process_experiment_data(self, data: List[List]) -> Dict:
+    def process_experiment_data(self, data: Union[List[List], Dict[str, np.ndarray]]) -> Dict:
         """
         Process experimental data and calculate all metrics.
         
         Args:
-            data: List of experimental data rows
+            data: List of experimental data rows, or a dictionary of
+                column arrays as returned by DataLoader.load_csv_soa
             
         Returns:
             Dictionary containing results and statistics
         """
-        results = []
-        ground_truths = {}
-        gt_list = []
-        pred_list = []
-        dcr_values = []
-        raw_acc_values = []
-        
-        for row in data:
-            bdc_level, model, t1, t2, t3, t4, acc = row
-            
-            # Calculate DCR
-            dcr = self.calculate_dcr(t1, t2, t3, t4)
-            adj_acc = self.calculate_adjusted_accuracy(acc, dcr)
-            
-            # Track values for correlation
-            dcr_values.append(dcr)
-            raw_acc_values.append(acc)
-            
-            # Calculate delta
-            if bdc_level == 0:
-                ground_truths[model] = adj_acc
-                delta = 0.0
-            else:
-                if model in ground_truths:
-                    delta = self.calculate_delta(ground_truths[model], adj_acc)
-                    gt_list.append(ground_truths[model])
-                    pred_list.append(adj_acc)
-                else:
-                    delta = 0.0
-            
-            results.append({
+        columns = data if isinstance(data, dict) else self._rows_to_columns(data)
+        
+        bdc_levels = np.asarray(columns['bdc_level'], dtype=np.int64)
+        models = np.asarray(columns['model'], dtype=object)
+        raw_acc = np.asarray(columns['accuracy'], dtype=np.float64)
+        scores = np.column_stack([
+            np.asarray(columns[f'test{i}'], dtype=np.float64) for i in range(1, 5)
+        ])
+        
+        # Calculate DCR for all rows in a single batched pass
+        dcr = self.fuzzy_system.calculate_dcr_batch(scores)
+        adj_acc = self.calculate_adjusted_accuracy(raw_acc, dcr)
+        
+        # Build the BDC 0 baseline lookup once, then align it with every row
+        is_baseline = bdc_levels == 0
+        baselines = dict(zip(models[is_baseline].tolist(), adj_acc[is_baseline].tolist()))
+        ground_truth = np.array([baselines.get(model, np.nan) for model in models.tolist()],
+                                dtype=np.float64)
+        
+        # Calculate delta
+        has_baseline = (bdc_levels != 0) & ~np.isnan(ground_truth)
+        delta = np.where(has_baseline, self.calculate_delta(ground_truth, adj_acc), 0.0)
+        
+        results = [
+            {
                 'model': model,
                 'bdc_level': bdc_level,
-                'dcr': dcr,
+                'dcr': dcr_value,
                 'raw_acc': acc,
-                'adj_acc': adj_acc,
-                'delta': delta
-            })
+                'adj_acc': adj,
+                'delta': row_delta
+            }
+            for model, bdc_level, dcr_value, acc, adj, row_delta in zip(
+                models.tolist(), bdc_levels.tolist(), dcr.tolist(),
+                raw_acc.tolist(), adj_acc.tolist(), delta.tolist())
+        ]
         
         # Calculate statistics
-        avg_error = self.calculate_average_error(gt_list, pred_list)
-        corr_coef, p_value = self.calculate_correlation(dcr_values, raw_acc_values)
+        avg_error = self.calculate_average_error(ground_truth[has_baseline].tolist(),
+                                                 adj_acc[has_baseline].tolist())
+        corr_coef, p_value = self.calculate_correlation(dcr.tolist(), raw_acc.tolist())
         
         return {
             'results': results,
             'average_error': avg_error,
             'correlation': corr_coef,
             'p_value': p_value
-        }
\ No newline at end of file
+        }
+    
+    @staticmethod
+    def _rows_to_columns(data: List[List]) -> Dict[str, list]:
+        """Transpose experimental data rows into per-column lists."""
+        if not data:
+            return {name: [] for name in EXPERIMENT_COLUMNS}
+        return dict(zip(EXPERIMENT_COLUMNS, map(list, zip(*data))))
@@ -2,9 +2,150 @@
 Fuzzy inference system for DCR calculation.
 """
 
+import functools
+from collections import OrderedDict
+
 import numpy as np
-import skfuzzy as fuzz
-from skfuzzy import interp_membership, defuzz
+
+
+def _centroid(x, mfx):
+    """
+    Piecewise-linear centroid along the last axis of ``mfx``.
+
+    Equivalent to ``skfuzzy.defuzz(x, mfx, 'centroid')`` without its
+    per-segment Python loop, and accepts a stack of membership functions,
+    one per row.
+    """
+    dx = np.diff(x)
+    y1, y2 = mfx[..., :-1], mfx[..., 1:]
+    area = 0.5 * dx * (y1 + y2)
+    moment = dx * dx / 6.0 * (y1 + 2.0 * y2) + x[:-1] * area
+    return moment.sum(axis=-1) / np.fmax(area.sum(axis=-1), np.finfo(float).eps)
+
+
+def _sanitize_scores(scores):
+    """Clamp contamination scores to [0, 1], treating NaN as 0."""
+    return np.clip(np.nan_to_num(scores, nan=0.0), 0.0, 1.0)
+
+
+def _dcr_kernel(s1, s2, s3, s4, x, input_mf, output_mf):
+    """
+    Scalar DCR pipeline written as explicit loops over the grid.
+    
+    Mirrors FuzzySystem.calculate_dcr and _apply_rules so it can be
+    compiled with Numba; returns the unrounded DCR factor.
+    """
+    n = x.shape[0]
+    scores = (s1, s2, s3, s4)
+    inputs = np.empty(4)
+    for i in range(4):
+        # Same as _sanitize_scores: NaN counts as 0, then clamp to [0, 1]
+        inputs[i] = 0.0 if np.isnan(scores[i]) else min(max(scores[i], 0.0), 1.0)
+    mean = (inputs[0] + inputs[1] + inputs[2] + inputs[3]) / 4.0
+    
+    # Set the threshold for negligible contamination
+    if mean < 0.02:
+        return 0.0
+    min_memb = max(0.001, mean)
+    
+    # Fuzzification by linear interpolation on the uniform grid
+    fuzzified = np.empty((3, 4))
+    for i in range(4):
+        pos = inputs[i] * (n - 1)
+        idx = int(pos)
+        frac = pos - idx
+        upper = min(idx + 1, n - 1)
+        for t in range(3):
+            memb = input_mf[t, idx] * (1.0 - frac) + input_mf[t, upper] * frac
+            fuzzified[t, i] = max(memb, min_memb * 0.1)
+    
+    # Rule strengths ordered like FuzzySystem.OUTPUT_TERMS
+    strengths = np.empty(5)
+    strengths[0] = min(min(fuzzified[0, 0], fuzzified[0, 1]),
+                       min(fuzzified[0, 2], fuzzified[0, 3]))
+    strengths[1] = max(fuzzified[1, 0], fuzzified[0, 1])
+    strengths[2] = (fuzzified[1, 0] + fuzzified[1, 1]
+                    + fuzzified[1, 2] + fuzzified[1, 3]) / 4.0
+    strengths[3] = max(fuzzified[2, 0], fuzzified[2, 1])
+    strengths[4] = max(fuzzified[2, 2], fuzzified[2, 3])
+    
+    # Clip and aggregate the output terms
+    aggregated = np.empty(n)
+    peak = 0.0
+    for j in range(n):
+        value = 0.0
+        for k in range(5):
+            value = max(value, min(strengths[k], output_mf[k, j]))
+        aggregated[j] = value
+        peak = max(peak, value)
+    
+    # Smoothing for low-value cases
+    if peak < 0.06:
+        for j in range(n):
+            aggregated[j] += output_mf[0, j] * min_memb
+    
+    # Piecewise-linear centroid, see _centroid
+    moment = 0.0
+    area = 0.0
+    for j in range(1, n):
+        dx = x[j] - x[j - 1]
+        seg = 0.5 * dx * (aggregated[j - 1] + aggregated[j])
+        moment += dx * dx / 6.0 * (aggregated[j - 1] + 2.0 * aggregated[j]) + x[j - 1] * seg
+        area += seg
+    dcr = moment / max(area, np.finfo(np.float64).eps)
+    return min(max(dcr, 0.0), 1.0)
+
+
+@functools.lru_cache(maxsize=None)
+def _jit_dcr_kernel():
+    """Compile _dcr_kernel with Numba on first use, or return None without it."""
+    try:
+        from numba import njit
+    except ImportError:  # Numba is optional, calculate_dcr falls back to NumPy
+        return None
+    # No 'nnan'/'ninf' fast-math flags: NaN scores must stay observable
+    return njit(fastmath={'contract', 'arcp'}, cache=True)(_dcr_kernel)
+
+
+def _setup_input_membership(x):
+    """Setup input membership functions (trapezoidal for wider coverage)."""
+    import skfuzzy as fuzz
+    return {
+        'Low': fuzz.trapmf(x, [0, 0, 0.1, 0.3]),
+        'Medium': fuzz.trapmf(x, [0.2, 0.4, 0.5, 0.6]),
+        'High': fuzz.trapmf(x, [0.5, 0.8, 1.0, 1.0])
+    }
+
+
+def _setup_output_membership(x):
+    """Setup output membership functions."""
+    import skfuzzy as fuzz
+    return {
+        'Negligible': fuzz.trapmf(x, [0, 0, 0.1, 0.3]),
+        'Minor': fuzz.trimf(x, [0.1, 0.3, 0.5]),
+        'Moderate': fuzz.trimf(x, [0.3, 0.5, 0.7]),
+        'Significant': fuzz.trimf(x, [0.5, 0.7, 0.9]),
+        'Severe': fuzz.trapmf(x, [0.7, 0.9, 1.0, 1.0])
+    }
+
+
+@functools.lru_cache(maxsize=None)
+def _membership_grids():
+    """
+    Build the universe and stacked membership grids on first use.
+    
+    The grids never change, so they are built once (deferring the skfuzzy
+    import until then) and shared read-only between all FuzzySystem instances.
+    """
+    x = np.linspace(0, 1, 101)
+    input_terms = _setup_input_membership(x)
+    output_terms = _setup_output_membership(x)
+    input_mf = np.stack([input_terms[t] for t in FuzzySystem.INPUT_TERMS]).astype(np.float32)
+    output_mf = np.stack([output_terms[t] for t in FuzzySystem.OUTPUT_TERMS]).astype(np.float32)
+    x = x.astype(np.float32)
+    for grid in (x, input_mf, output_mf):
+        grid.setflags(write=False)
+    return x, input_mf, output_mf
 
 
 class FuzzySystem:
@@ -12,28 +153,38 @@ class FuzzySystem:
     Implements the fuzzy inference system for calculating Data Contamination Risk (DCR).
     """
     
-    def __init__(self):
-        self.x = np.linspace(0, 1, 101)
-        self.input_terms = self._setup_input_membership()
-        self.output_terms = self._setup_output_membership()
-    
-    def _setup_input_membership(self):
-        """Setup input membership functions (trapezoidal for wider coverage)."""
-        return {
-            'Low': fuzz.trapmf(self.x, [0, 0, 0.1, 0.3]),
-            'Medium': fuzz.trapmf(self.x, [0.2, 0.4, 0.5, 0.6]),
-            'High': fuzz.trapmf(self.x, [0.5, 0.8, 1.0, 1.0])
-        }
-    
-    def _setup_output_membership(self):
-        """Setup output membership functions."""
-        return {
-            'Negligible': fuzz.trapmf(self.x, [0, 0, 0.1, 0.3]),
-            'Minor': fuzz.trimf(self.x, [0.1, 0.3, 0.5]),
-            'Moderate': fuzz.trimf(self.x, [0.3, 0.5, 0.7]),
-            'Significant': fuzz.trimf(self.x, [0.5, 0.7, 0.9]),
-            'Severe': fuzz.trapmf(self.x, [0.7, 0.9, 1.0, 1.0])
-        }
+    INPUT_TERMS = ('Low', 'Medium', 'High')
+    OUTPUT_TERMS = ('Negligible', 'Minor', 'Moderate', 'Significant', 'Severe')
+    
+    # Rows evaluated at once by calculate_dcr_batch
+    BATCH_BLOCK_ROWS = 8192
+    
+    # Most recent single-row results remembered by calculate_dcr
+    DCR_MEMO_SIZE = 4096
+    
+    def __init__(self, nearest_bin: bool = False):
+        """
+        Args:
+            nearest_bin: Fuzzify batched inputs by snapping them to the
+                nearest grid point instead of interpolating between points
+        """
+        self.nearest_bin = nearest_bin
+        
+        # Shared read-only grids, stacked in INPUT_TERMS/OUTPUT_TERMS order
+        self.x, self.input_mf, self.output_mf = _membership_grids()
+        self.input_terms = dict(zip(self.INPUT_TERMS, self.input_mf))
+        self.output_terms = dict(zip(self.OUTPUT_TERMS, self.output_mf))
+        
+        # Scratch buffers reused by _apply_rules on every call
+        self._strength_buf = np.empty((len(self.OUTPUT_TERMS), 1), dtype=np.float32)
+        self._rule_buf = np.empty_like(self.output_mf)
+        self._agg_buf = np.empty_like(self.x)
+        self._tmp_buf = np.empty_like(self.x)
+        
+        # Per-instance LRU memo of DCR results keyed by the exact input scores;
+        # a plain dict rather than lru_cache over a bound method, which would
+        # make every instance reference itself
+        self._dcr_memo = OrderedDict()
     
     def calculate_dcr(self, s1, s2, s3, s4):
         """
@@ -48,75 +199,153 @@ class FuzzySystem:
         Returns:
             float: DCR factor between 0 and 1
         """
+        key = (float(s1), float(s2), float(s3), float(s4))
+        memo = self._dcr_memo
+        if key in memo:
+            memo.move_to_end(key)
+            return memo[key]
+        
+        dcr = self._calculate_dcr(*key)
+        memo[key] = dcr
+        if len(memo) > self.DCR_MEMO_SIZE:
+            memo.popitem(last=False)
+        return dcr
+    
+    def _calculate_dcr(self, s1, s2, s3, s4):
+        """Uncached DCR calculation behind calculate_dcr."""
+        kernel = _jit_dcr_kernel()
+        if kernel is not None:
+            dcr = kernel(float(s1), float(s2), float(s3), float(s4),
+                         self.x, self.input_mf, self.output_mf)
+            return round(dcr, 4)
+        
         # Input sanitization with proportional minimum
-        inputs = [max(0.0, min(float(v), 1.0)) for v in [s1, s2, s3, s4]]
-        min_memb = max(0.001, np.mean(inputs))  # Dynamic minimum based on inputs
+        inputs = _sanitize_scores(np.array([s1, s2, s3, s4], dtype=np.float64))
+        mean = float(inputs.mean())
+        min_memb = max(0.001, mean)  # Dynamic minimum based on inputs
         
         # Set the threshold for negligible contamination
-        if np.mean(inputs) < 0.02:
+        if mean < 0.02:
             return 0.0
         
-        # Enhanced fuzzification
-        fuzzified = {}
-        for i, val in enumerate(inputs):
-            fuzzified[f'L{i+1}'] = {
-                term: max(interp_membership(self.x, mf, val), min_memb*0.1)
-                for term, mf in self.input_terms.items()
-            }
-        
-        try:
-            # Apply fuzzy rules
-            aggregated = self._apply_rules(fuzzified, min_memb)
-            
-            # Defuzzification
-            dcr = defuzz(self.x, aggregated, 'centroid')
-            return round(max(min(dcr, 1.0), 0.0), 4)
+        # Enhanced fuzzification: linear interpolation on the uniform grid,
+        # giving a (3, 4) array of memberships indexed by [term, input]
+        pos = inputs * (len(self.x) - 1)
+        idx = pos.astype(np.intp)
+        frac = pos - idx
+        upper = np.minimum(idx + 1, len(self.x) - 1)
+        fuzzified = self.input_mf[:, idx] * (1 - frac) + self.input_mf[:, upper] * frac
+        np.maximum(fuzzified, min_memb * 0.1, out=fuzzified)
         
-        except Exception as e:
+        # Apply fuzzy rules
+        aggregated = self._apply_rules(fuzzified, min_memb)
+        
+        # Fall back to the proportional minimum when no rule fires
+        if aggregated.sum() <= 0:
             return round(min_memb, 3)
+        
+        # Defuzzification
+        dcr = float(_centroid(self.x, aggregated))
+        return round(min(max(dcr, 0.0), 1.0), 4)
+    
+    def calculate_dcr_batch(self, scores):
+        """
+        Calculate DCR factors for many rows of contamination scores at once.
+        
+        Args:
+            scores: Array-like of shape (N, 4) holding the L1-L4 scores per row
+            
+        Returns:
+            np.ndarray: DCR factors of shape (N,), each between 0 and 1
+        """
+        scores = np.asarray(scores, dtype=float)
+        if scores.ndim != 2 or scores.shape[1] != 4:
+            raise ValueError(f"Expected scores of shape (N, 4), got {scores.shape}")
+        
+        inputs = _sanitize_scores(scores)
+        means = inputs.mean(axis=1)
+        dcr = np.zeros(len(inputs))
+        
+        # Set the threshold for negligible contamination: those rows stay at
+        # 0.0 and skip fuzzy inference entirely
+        active = np.flatnonzero(means >= 0.02)
+        
+        # Evaluate in fixed-size blocks so the per-row grid temporaries stay
+        # bounded no matter how many rows are passed in
+        for start in range(0, len(active), self.BATCH_BLOCK_ROWS):
+            rows = active[start:start + self.BATCH_BLOCK_ROWS]
+            dcr[rows] = self._calculate_dcr_block(inputs[rows], means[rows])
+        return dcr
+    
+    def _calculate_dcr_block(self, inputs, means):
+        """Run fuzzy inference on an (N, 4) block of sanitized, non-negligible rows."""
+        min_memb = np.maximum(0.001, means)
+        
+        # Fuzzification: (N, 4, 3) memberships indexed by [row, input, term]
+        if self.nearest_bin:
+            # Single gather at the nearest of the uniformly spaced grid points
+            last = len(self.x) - 1
+            bins = np.clip((inputs * last + 0.5).astype(np.intp), 0, last)
+            fuzzified = np.moveaxis(self.input_mf[:, bins], 0, -1)
+        else:
+            fuzzified = np.stack([
+                np.interp(inputs, self.x, mf) for mf in self.input_mf
+            ], axis=-1)
+        fuzzified = np.maximum(fuzzified, (min_memb * 0.1)[:, None, None])
+        
+        low, medium, high = fuzzified[..., 0], fuzzified[..., 1], fuzzified[..., 2]
+        
+        # Rule strengths ordered like OUTPUT_TERMS, see _apply_rules
+        strengths = np.stack([
+            low.min(axis=1),
+            np.fmax(medium[:, 0], low[:, 1]),
+            medium.mean(axis=1),
+            np.fmax(high[:, 0], high[:, 1]),
+            np.fmax(high[:, 2], high[:, 3]),
+        ], axis=1).astype(np.float32)
+        
+        # Clip each output term by its rule strength and fold it into a
+        # single (N, 101) maximum accumulator
+        aggregated = np.fmin(strengths[:, 0, None], self.output_mf[0])
+        clipped = np.empty_like(aggregated)
+        for k in range(1, len(self.output_mf)):
+            np.fmin(strengths[:, k, None], self.output_mf[k], out=clipped)
+            np.fmax(aggregated, clipped, out=aggregated)
+        
+        # Smoothing for low-value cases
+        smooth = aggregated.max(axis=1) < 0.06
+        if smooth.any():
+            aggregated[smooth] += self.output_mf[0] * min_memb[smooth, None]
+        
+        return np.round(np.clip(_centroid(self.x, aggregated), 0.0, 1.0), 4)
     
     def _apply_rules(self, fuzzified, min_memb):
-        """Apply fuzzy inference rules."""
+        """Apply fuzzy inference rules to a (3, 4) [term, input] membership array."""
+        low, medium, high = fuzzified
+        strengths = self._strength_buf
+        
         # Rule 0: If all inputs are low, then contamination is Negligible
-        rule0 = np.fmin(
-            np.fmin(fuzzified['L1']['Low'], fuzzified['L2']['Low']),
-            np.fmin(fuzzified['L3']['Low'], fuzzified['L4']['Low'])
-        )
-        rule0 = np.fmin(rule0, self.output_terms['Negligible'])
+        strengths[0] = low.min()
         
-        # Rule: If L3 or L4 is high then contamination is Severe
-        rule_severe = np.fmin(
-            np.fmax(fuzzified['L3']['High'], fuzzified['L4']['High']),
-            self.output_terms['Severe']
-        )
+        # Rule: If lower inputs show slight elevation, then it is Minor
+        strengths[1] = max(medium[0], low[1])
+        
+        # Rule: If overall medium membership is high, then consider it Moderate
+        strengths[2] = medium.mean()
         
         # Rule: If L1 or L2 is high then contamination is Significant
-        rule_significant = np.fmin(
-            np.fmax(fuzzified['L1']['High'], fuzzified['L2']['High']),
-            self.output_terms['Significant']
-        )
+        strengths[3] = max(high[0], high[1])
         
-        # Rule: If overall medium membership is high, then consider it Moderate
-        medium_avg = np.mean([fuzzified[f'L{i+1}']['Medium'] for i in range(4)])
-        rule_moderate = np.fmin(medium_avg, self.output_terms['Moderate'])
+        # Rule: If L3 or L4 is high then contamination is Severe
+        strengths[4] = max(high[2], high[3])
         
-        # Rule: If lower inputs show slight elevation, then it is Minor
-        rule_minor = np.fmin(
-            np.fmax(fuzzified['L1']['Medium'], fuzzified['L2']['Low']),
-            self.output_terms['Minor']
-        )
-        
-        # Aggregate all rules using maximum operator
-        aggregated = np.fmax.reduce([
-            rule0,
-            rule_severe,
-            rule_significant,
-            rule_moderate,
-            rule_minor,
-        ])
+        # Clip every output term by its rule strength in one broadcast, then
+        # aggregate all rules using maximum operator
+        rules = np.minimum(strengths, self.output_mf, out=self._rule_buf)
+        aggregated = np.max(rules, axis=0, out=self._agg_buf)
         
         # Smoothing for low-value cases
-        if np.max(aggregated) < 0.06:
-            aggregated += self.output_terms['Negligible'] * min_memb
+        if aggregated.max() < 0.06:
+            aggregated += np.multiply(self.output_mf[0], min_memb, out=self._tmp_buf)
         
-        return aggregated
\ No newline at end of file
+        return aggregated
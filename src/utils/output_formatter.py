@@ -10,11 +10,52 @@ class OutputFormatter:
     Formats and displays DCR analysis results.
     """
     
+    @staticmethod
+    def format_header() -> str:
+        """Format the results table header."""
+        return (f"{'Model':<15} | {'BDC':<4} | {'DCR':<6} | {'Raw Acc':<7} | {'Adj Acc':<7} | {'Delta':<7}\n"
+                + "-" * 65)
+    
+    @staticmethod
+    def format_result(result: Dict) -> str:
+        """
+        Format a single result row.
+        
+        Args:
+            result: Dictionary containing result data
+            
+        Returns:
+            Formatted row string
+        """
+        return (f"{result['model']:<15} | {result['bdc_level']:4} | "
+                f"{result['dcr']:6.4f} | {result['raw_acc']:6.2f}% | "
+                f"{result['adj_acc']:6.2f}% | {result['delta']:6.2f}%")
+    
+    @staticmethod
+    def format_statistics(avg_error: float, correlation: float, p_value: float) -> str:
+        """
+        Format statistical summary.
+        
+        Args:
+            avg_error: Average error percentage
+            correlation: Pearson correlation coefficient
+            p_value: Statistical p-value
+            
+        Returns:
+            Formatted summary string
+        """
+        return '\n'.join([
+            "-" * 65,
+            f"Average Error (compared to BDC 0): {avg_error:.2f}%",
+            "-" * 65,
+            f"Correlation between DCR and Raw Acc (Pearson): {correlation:.4f}, "
+            f"p-value: {p_value:.8f}"
+        ])
+    
     @staticmethod
     def print_header():
         """Print the results table header."""
-        print(f"{'Model':<15} | {'BDC':<4} | {'DCR':<6} | {'Raw Acc':<7} | {'Adj Acc':<7} | {'Delta':<7}")
-        print("-" * 65)
+        print(OutputFormatter.format_header())
     
     @staticmethod
     def print_result(result: Dict):
@@ -24,9 +65,7 @@ class OutputFormatter:
         Args:
             result: Dictionary containing result data
         """
-        print(f"{result['model']:<15} | {result['bdc_level']:4} | "
-              f"{result['dcr']:6.4f} | {result['raw_acc']:6.2f}% | "
-              f"{result['adj_acc']:6.2f}% | {result['delta']:6.2f}%")
+        print(OutputFormatter.format_result(result))
     
     @staticmethod
     def print_statistics(avg_error: float, correlation: float, p_value: float):
@@ -38,11 +77,7 @@ class OutputFormatter:
             correlation: Pearson correlation coefficient
             p_value: Statistical p-value
         """
-        print("-" * 65)
-        print(f"Average Error (compared to BDC 0): {avg_error:.2f}%")
-        print("-" * 65)
-        print(f"Correlation between DCR and Raw Acc (Pearson): {correlation:.4f}, "
-              f"p-value: {p_value:.8f}")
+        print(OutputFormatter.format_statistics(avg_error, correlation, p_value))
     
     @staticmethod
     def format_results_table(results: List[Dict], stats: Dict) -> str:
@@ -59,14 +94,10 @@ class OutputFormatter:
         output = []
         
         # Header
-        output.append(f"{'Model':<15} | {'BDC':<4} | {'DCR':<6} | {'Raw Acc':<7} | {'Adj Acc':<7} | {'Delta':<7}")
-        output.append("-" * 65)
+        output.append(OutputFormatter.format_header())
         
         # Results
-        for result in results:
-            output.append(f"{result['model']:<15} | {result['bdc_level']:4} | "
-                         f"{result['dcr']:6.4f} | {result['raw_acc']:6.2f}% | "
-                         f"{result['adj_acc']:6.2f}% | {result['delta']:6.2f}%")
+        output.extend(OutputFormatter.format_result(result) for result in results)
         
         # Statistics
         output.append("-" * 65)
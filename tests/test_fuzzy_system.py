@@ -0,0 +1,81 @@
+"""
+Tests for FuzzySystem, mainly consistency between its DCR implementations.
+"""
+
+import gc
+import weakref
+
+import numpy as np
+import pytest
+
+from src.core import fuzzy_system
+from src.core.fuzzy_system import FuzzySystem, _dcr_kernel
+
+# Results are rounded to 4 decimals; the float32 grids may move a value
+# to the neighbouring 4th decimal
+TOLERANCE = 1.01e-4
+
+
+@pytest.fixture
+def scores():
+    rng = np.random.default_rng(0)
+    rows = np.concatenate([
+        np.round(rng.random((500, 4)), 2),
+        rng.random((200, 4)) * 0.1,
+        rng.random((200, 4)) * 1.2 - 0.1,
+        [[np.nan, 0.5, 0.5, 0.5], [np.inf, 0.5, 0.5, -np.inf], [np.nan] * 4],
+    ])
+    return np.round(rows, 4)
+
+
+@pytest.fixture
+def numpy_system(monkeypatch):
+    monkeypatch.setattr(fuzzy_system, '_jit_dcr_kernel', lambda: None)
+    return FuzzySystem()
+
+
+def _kernel_results(kernel, system, scores):
+    return np.array([
+        round(kernel(*row, system.x, system.input_mf, system.output_mf), 4)
+        for row in scores
+    ])
+
+
+def test_batch_matches_numpy_path(numpy_system, scores):
+    single = np.array([numpy_system.calculate_dcr(*row) for row in scores])
+    batch = numpy_system.calculate_dcr_batch(scores)
+    np.testing.assert_allclose(batch, single, rtol=0, atol=TOLERANCE)
+
+
+def test_kernel_matches_numpy_path(numpy_system, scores):
+    single = np.array([numpy_system.calculate_dcr(*row) for row in scores])
+    kernel = _kernel_results(_dcr_kernel, numpy_system, scores)
+    np.testing.assert_allclose(kernel, single, rtol=0, atol=TOLERANCE)
+
+
+def test_compiled_kernel_matches_python_kernel(scores):
+    kernel = fuzzy_system._jit_dcr_kernel()
+    if kernel is None:
+        pytest.skip('numba is not installed')
+    system = FuzzySystem()
+    np.testing.assert_array_equal(_kernel_results(kernel, system, scores),
+                                  _kernel_results(_dcr_kernel, system, scores))
+
+
+def test_nan_scores_count_as_zero(numpy_system):
+    expected = numpy_system.calculate_dcr(0.0, 0.5, 0.5, 0.5)
+    assert expected > 0
+    assert numpy_system.calculate_dcr(np.nan, 0.5, 0.5, 0.5) == expected
+    assert numpy_system.calculate_dcr_batch([[np.nan, 0.5, 0.5, 0.5]])[0] == expected
+
+
+def test_instance_freed_without_cycle_collection():
+    system = FuzzySystem()
+    system.calculate_dcr(0.3, 0.2, 0.5, 0.1)
+    ref = weakref.ref(system)
+    gc.disable()
+    try:
+        del system
+        assert ref() is None
+    finally:
+        gc.enable()